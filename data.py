@@ -1,74 +1,189 @@
+import os
+import pickle
+from datetime import date
+from functools import lru_cache
+from hashlib import sha256
+
 import gspread as gs
+from cachetools.func import ttl_cache
 from decouple import config, Csv
 from google.oauth2.service_account import Credentials
-from pandas import DataFrame, concat
+from gspread.utils import ValueRenderOption, absolute_range_name, fill_gaps
+from numpy import concatenate, ndarray
+from pandas import DataFrame, to_numeric
+
+CREDS_PATH = config('CREDS_PATH')
+SPREADSHEET_TITLE = config('SPREADSHEET_TITLE')
+WORKSHEET_TITLE = config('WORKSHEET_TITLE')
+# Optional A1 columns of the worksheet holding the desired columns (e.g. 'A:M'), the whole worksheet if empty
+DATA_COLUMNS = config('DATA_COLUMNS', default='')
+# List of required scopes to authorize access to Google Sheets and Google Drive
+ACCESS_SCOPES = config('ACCESS_SCOPES', cast=Csv(post_process=tuple))
+
+VALUES_CACHE_TTL: int = 30  # Seconds the values read from the spreadsheet are reused before reading them again
+VALUES_CACHE_FOLDER = 'cache'  # Folder where the values are stored between runs while the spreadsheet is unchanged
+VALUES_MAJOR_DIMENSION = 'COLUMNS'  # Values are requested column by column, the layout the DataFrames are built from
 
+DESIRED_COLUMNS = ['WSP', 'PLAT.', 'CORTE', 'CLIENTE', 'PANTALLA', 'TELEFONO', 'VALOR', 'DIAS']
+GROUP_COLUMNS = ['SIGLAS', 'VENDEDOR', 'CLIENTE', 'TELEFONO']
+FINAL_COLUMNS = ['VENDEDOR', 'CLIENTE', 'TELEFONO', 'MENSAJE']
 
-def get_worksheet(credentials_file_path: str) -> gs.Worksheet:
+
+@lru_cache(maxsize=4)
+def get_client(credentials_file_path: str, access_scopes: tuple[str, ...]) -> gs.Client:
     """
-    Get the Google Spreadsheet worksheet for processing.
+    Get an authorized gspread client, created once per credentials file and scopes for the process lifetime.
 
     Args:
         credentials_file_path (str): Path to the credentials JSON file
+        access_scopes (tuple[str, ...]): Scopes to authorize access to Google Sheets and Google Drive.
 
     Returns:
-        gspread.Worksheet: Worksheet for processing.
+        gspread.Client: Authorized client.
     """
 
-    spreadsheet_title = config('SPREADSHEET_TITLE')
-    worksheet_title = config('WORKSHEET_TITLE')
-
-    # List of required scopes to authorize access to Google Sheets and Google Drive
-    access_scopes = config('ACCESS_SCOPES', cast=Csv())
-
     # Create access credentials using the service account JSON file
     credentials = Credentials.from_service_account_file(credentials_file_path, scopes=access_scopes)
 
     # Authorize access to Google Sheets using the credentials
-    gc = gs.authorize(credentials)
+    return gs.authorize(credentials)
 
-    # Open the Google Spreadsheet and select the Worksheet
-    sh = gc.open(spreadsheet_title)
-    worksheet = sh.worksheet(worksheet_title)
 
-    return worksheet
+@lru_cache(maxsize=4)
+def get_spreadsheet(credentials_file_path: str, spreadsheet_title: str) -> gs.Spreadsheet:
+    """
+    Get the Google Spreadsheet for processing, opened once per credentials file and title for the process lifetime.
 
+    Args:
+        credentials_file_path (str): Path to the credentials JSON file
+        spreadsheet_title (str): Title of the spreadsheet to open.
 
-def get_dataframe_by_range_name(worksheet: gs.Worksheet, range_name: str) -> DataFrame:
+    Returns:
+        gspread.Spreadsheet: Spreadsheet for processing.
     """
-    Get DataFrame from a specific range in the worksheet.
+
+    # Reuse the authorized client instead of parsing the key and exchanging a token again
+    gc = get_client(credentials_file_path, ACCESS_SCOPES)
+
+    # Open the Google Spreadsheet
+    return gc.open(spreadsheet_title)
+
+
+def batch_get_values(spreadsheet: gs.Spreadsheet, ranges: list[str]) -> list[list[list[str]]]:
+    """
+    Get the values of several ranges, as the text shown in the sheet, with a single Sheets API request.
 
     Args:
-        worksheet (Worksheet): The worksheet object.
-        range_name (str): The name of the range to get.
+        spreadsheet (Spreadsheet): The spreadsheet object.
+        ranges (list[str]): A1 notations or named ranges to get.
 
     Returns:
-        DataFrame: DataFrame extracted from the specified range.
+        list: The values of each range, in the same order as `ranges`, as columns padded to the same length.
     """
-    data = worksheet.get(range_name)
-    df = DataFrame(data[1:], columns=data[0])
-    df = add_phone_column(df)
+    response = spreadsheet.values_batch_get(ranges=ranges, params={
+        'majorDimension': VALUES_MAJOR_DIMENSION,
+        'valueRenderOption': ValueRenderOption.formatted,
+    })
 
-    return df
+    # The API omits 'values' for empty ranges and trims trailing empty cells, unlike get_all_values()
+    return [fill_gaps(value_range.get('values', [[]])) for value_range in response['valueRanges']]
 
 
-def add_phone_column(df: DataFrame) -> DataFrame:
+def get_stored_values(spreadsheet: gs.Spreadsheet, ranges: list[str]) -> list[list[list[str]]]:
     """
-    Add 'TELEFONO' column by combining 'INDICATIVO' and 'CONTACTO' columns.
+    Get the values of several ranges, read from disk if stored today and the spreadsheet has not changed since.
+
+    The spreadsheet's last update time is a cheap Drive API metadata request, so re-runs over an unchanged
+    spreadsheet skip the values request entirely. Formulas depending on the current date (like 'DIAS') are
+    recalculated without changing the last update time, so stored values are only reused on the day they were read.
 
     Args:
-        df (DataFrame): DataFrame containing the original data.
+        spreadsheet (Spreadsheet): The spreadsheet object.
+        ranges (list[str]): A1 notations or named ranges to get.
+
+    Returns:
+        list: The values of each range, in the same order as `ranges`.
+    """
+    version = (spreadsheet.get_lastUpdateTime(), date.today().isoformat())
+
+    # One file per spreadsheet, layout and ranges, holding the last update time and day its values belong to
+    file_name = sha256('|'.join([spreadsheet.id, VALUES_MAJOR_DIMENSION, *ranges]).encode('utf-8')).hexdigest()
+    file_path = os.path.join(VALUES_CACHE_FOLDER, f'{file_name}.pkl')
+
+    if os.path.exists(file_path):
+        with open(file_path, 'rb') as file:
+            stored_version, values = pickle.load(file)
+
+        if stored_version == version:
+            return values
+
+    values = batch_get_values(spreadsheet, ranges)
+
+    if not os.path.exists(VALUES_CACHE_FOLDER):
+        os.makedirs(VALUES_CACHE_FOLDER)
+
+    # Write to a temporary file and move it, so an interrupted run never leaves a truncated file behind
+    temp_file_path = f'{file_path}.tmp'
+    with open(temp_file_path, 'wb') as file:
+        pickle.dump((version, values), file)
+    os.replace(temp_file_path, file_path)
+
+    return values
+
+
+@ttl_cache(maxsize=32, ttl=VALUES_CACHE_TTL)
+def get_cached_values(
+        credentials_file_path: str,
+        spreadsheet_title: str,
+        ranges: tuple[str, ...]) -> list[list[list[str]]]:
+    """
+    Get the values of several ranges, reusing the last response for the same ranges within `VALUES_CACHE_TTL` seconds.
+
+    The raw values are cached rather than DataFrames, so every caller still builds its own frame.
+
+    Args:
+        credentials_file_path (str): Path to the credentials JSON file
+        spreadsheet_title (str): Title of the spreadsheet to read.
+        ranges (tuple[str, ...]): A1 notations or named ranges to get.
 
     Returns:
-        DataFrame: DataFrame with 'TELEFONO' column added.
+        list: The values of each range, in the same order as `ranges`.
     """
-    # Combine 'INDICATIVO' and 'CONTACTO' columns to create 'TELEFONO'
-    df['TELEFONO'] = df['INDICATIVO'] + ' ' + df['CONTACTO']
+    sh = get_spreadsheet(credentials_file_path, spreadsheet_title)
+    return get_stored_values(sh, list(ranges))
 
-    # Drop unnecessary columns
-    df.drop(columns=['INDICATIVO', 'CONTACTO'], inplace=True)
 
-    return df
+def refresh() -> None:
+    """
+    Discard the cached spreadsheet values so the next read goes to the Sheets API.
+    """
+    get_cached_values.cache_clear()
+
+
+def get_dataframe_from_columns(columns: list[list[str]], header_index: int = 0) -> DataFrame:
+    """
+    Get DataFrame from the columns of a range, each one holding its header name and then its values.
+
+    'INDICATIVO' and 'CONTACTO' are combined into a 'TELEFONO' column while building the frame, so they are never
+    stored on their own.
+
+    Args:
+        columns (list[list[str]]): The values of each column, all of the same length.
+        header_index (int): Position of the header name in every column, the values start right after it.
+
+    Returns:
+        DataFrame: DataFrame with one column per header name, stripped of surrounding spaces.
+    """
+    # Columns too short to hold a header are empty in the sheet, the rest go to pandas as they came
+    values_by_name = {column[header_index].strip(): column[header_index + 1:]
+                      for column in columns if len(column) > header_index}
+
+    # Combine 'INDICATIVO' and 'CONTACTO' to create 'TELEFONO' in place of both
+    if 'INDICATIVO' in values_by_name and 'CONTACTO' in values_by_name:
+        values_by_name['TELEFONO'] = [f'{code} {contact}' for code, contact in
+                                      zip(values_by_name.pop('INDICATIVO'), values_by_name.pop('CONTACTO'))]
+
+    return DataFrame(values_by_name)
 
 
 def clean_data(df: DataFrame, desired_columns: list[str]) -> DataFrame:
@@ -89,48 +204,62 @@ def clean_data(df: DataFrame, desired_columns: list[str]) -> DataFrame:
     if df.empty:
         raise Exception("Input DataFrame is empty")
 
-    # Copy the DataFrame and keep only the desired columns
-    df_cleaned = df[desired_columns].copy()
+    # Remove the dollar sign /'$'/ from 'VALOR' column and parse it as a number, malformed values become NaN
+    valor = to_numeric(df['VALOR'].str.strip().str.removeprefix('$'), errors='coerce')
 
-    # Add 'TELEFONO' column
-    df_cleaned = add_phone_column(df_cleaned)
+    # Convert 'CORTE' column to bool, anything other than 'TRUE' is not cut
+    corte = df['CORTE'].eq('TRUE')
 
-    # Rename columns 'WSP' to 'VENDEDOR' and 'PLAT.' to 'PLATAFORMA'
-    df_cleaned = df_cleaned.rename(columns={'WSP': 'VENDEDOR', 'PLAT.': 'PLATAFORMA'})
+    # Keep rows where 'VALOR' is greater than 0 and 'CORTE' is not true, and only the desired columns except
+    # 'VALOR' and 'CORTE', which are no longer needed once the rows are filtered; .loc already returns a new frame
+    kept_columns = [column for column in desired_columns if column not in ('VALOR', 'CORTE')]
+    df_cleaned = df.loc[(valor > 0) & ~corte, kept_columns]
 
-    # Remove the dollar sign /'$'/ from 'VALOR' column and convert it to float
-    df_cleaned['VALOR'] = df_cleaned['VALOR'].str.replace('$', '').astype(float)
+    # Rename columns 'WSP' to 'VENDEDOR' and 'PLAT.' to 'PLATAFORMA', relabelling the new frame in place
+    df_cleaned.rename(columns={'WSP': 'VENDEDOR', 'PLAT.': 'PLATAFORMA'}, inplace=True)
 
-    # Convert 'CORTE' column to bool
-    df_cleaned['CORTE'] = df_cleaned['CORTE'].map({'TRUE': True, 'FALSE': False}).astype(bool)
+    # Store the low-cardinality columns as categories so filters and groupbys compare integer codes
+    for column in ('VENDEDOR', 'PLATAFORMA', 'DIAS'):
+        df_cleaned[column] = df_cleaned[column].astype('category')
 
-    # Filter out rows where 'VALOR' is greater than 0 and 'CORTE' is not true
-    df_cleaned = df_cleaned[(df_cleaned['VALOR'] > 0) & (~df_cleaned['CORTE'])]
+    return df_cleaned
 
-    # Drop the 'VALOR' column
-    df_cleaned.drop(columns=['VALOR'], inplace=True)
 
-    return df_cleaned
+def build_service(screens_by_platform: dict[str, dict[str, None]]) -> str:
+    """
+    Build the 'SERVICIO' text of a customer from its screens by platform.
+
+    Args:
+        screens_by_platform (dict[str, dict[str, None]]): Unique screens ('PANTALLA') of every platform
+            ('PLATAFORMA') of the customer, as dict keys in order of appearance.
+
+    Returns:
+        str: Each platform with its screens joined by ' & ', platforms joined by ' ▪️ '.
+    """
+    return ' ▪️ '.join(f"*{platform}*: _{' & '.join(screens)}_" for platform, screens in screens_by_platform.items())
 
 
 def process_data(df_filtered: DataFrame) -> DataFrame:
     """
-    Process the filtered DataFrame.
+    Process the filtered DataFrame, building one row per customer of each user ('SIGLAS').
 
     Args:
-        df_filtered (DataFrame): Filtered DataFrame.
+        df_filtered (DataFrame): Filtered DataFrame tagged with the 'SIGLAS' of each user.
 
     Returns:
         DataFrame: Processed DataFrame.
     """
-    df_grouped = df_filtered.groupby(['VENDEDOR', 'CLIENTE', 'PLATAFORMA', 'TELEFONO'])['PANTALLA'].unique().str.join(
-        ' & ').reset_index()
+    keys = zip(*(df_filtered[column].to_numpy() for column in GROUP_COLUMNS))
+    platforms = df_filtered['PLATAFORMA'].to_numpy()
+    screens = df_filtered['PANTALLA'].to_numpy()
 
-    # Create 'SERVICIO' column
-    df_grouped['SERVICIO'] = '*' + df_grouped['PLATAFORMA'] + '*: _' + df_grouped['PANTALLA'] + '_'
+    # Loop over the rows once, collecting the unique screens of each platform of every customer in order of appearance
+    services = {}
+    for key, platform, screen in zip(keys, platforms, screens):
+        services.setdefault(key, {}).setdefault(platform, {})[screen] = None
 
-    # Group by 'CLIENTE' and 'TELEFONO', concatenate values of 'SERVICIO' for each group using ' ▪️ '
-    df_grouped = df_grouped.groupby(['VENDEDOR', 'CLIENTE', 'TELEFONO'])['SERVICIO'].apply(' ▪️ '.join).reset_index()
+    rows = [(*key, build_service(screens_by_platform)) for key, screens_by_platform in services.items()]
+    df_grouped = DataFrame(rows, columns=[*GROUP_COLUMNS, 'SERVICIO'])
 
     return df_grouped
 
@@ -147,16 +276,19 @@ def add_message_column(df_grouped: DataFrame, day_str: str) -> DataFrame:
         DataFrame: DataFrame with the 'MESSAGE' column added.
     """
 
-    df_grouped['NOMBRE'] = df_grouped['CLIENTE'].str.split().str[0]
-    df_grouped['MENSAJE'] = 'Hola, ' + df_grouped['NOMBRE'] + '. Buen día. ' + day_str + ' otro mes de ' + df_grouped[
-        'SERVICIO'] + '. ¿Desea continuar?'
+    # Take the first word of the customer's name, splitting at most once instead of the whole name
+    df_grouped['NOMBRE'] = [(client.split(maxsplit=1) or [''])[0] for client in df_grouped['CLIENTE'].values]
+
+    # Fill the message template in one pass instead of chaining Series concatenations
+    df_grouped['MENSAJE'] = [f'Hola, {name}. Buen día. {day_str} otro mes de {service}. ¿Desea continuar?'
+                             for name, service in zip(df_grouped['NOMBRE'].values, df_grouped['SERVICIO'].values)]
 
     return df_grouped
 
 
-def filter_data_by_user_type(df_data: DataFrame, df_user_type: DataFrame, user_type: str) -> dict[str, DataFrame]:
+def filter_data_by_user_type(df_data: DataFrame, df_user_type: DataFrame, user_type: str) -> DataFrame:
     """
-    Get data based on each seller or reseller and store it in a dictionary.
+    Get the data of the sellers or resellers, tagged with the initials of the user each row belongs to.
 
     Args:
         df_data (DataFrame): DataFrame containing the data to filter.
@@ -164,59 +296,69 @@ def filter_data_by_user_type(df_data: DataFrame, df_user_type: DataFrame, user_t
         user_type (str): Type of user ('seller' or 'reseller').
 
     Returns:
-        dict: A dictionary where keys are user identifiers and values are filtered DataFrames.
+        DataFrame: Rows that belong to a user, with the user's initials in the 'SIGLAS' column.
     """
 
     # Determine the column to filter based on the user type
     filter_column_data = 'VENDEDOR' if user_type == 'seller' else 'TELEFONO'
     filter_column_user_type = 'SIGLAS' if user_type == 'seller' else 'TELEFONO'
 
-    # Initialize an empty dictionary to store filtered data
-    data_by_sellers = {}
+    # Map each user's identifier to its initials to tag every row with one vectorized pass
+    initials_by_key = dict(zip(df_user_type[filter_column_user_type], df_user_type['SIGLAS']))
+    df_tagged = df_data.assign(SIGLAS=df_data[filter_column_data].map(initials_by_key))
 
-    # Iterate over sellers' DataFrame
-    for _, seller in df_user_type.iterrows():
-        # Filter data for the current seller
-        filtered_data = df_data[df_data[filter_column_data] == seller[filter_column_user_type]]
+    # Drop rows that do not belong to any user
+    return df_tagged.dropna(subset=['SIGLAS'])
 
-        # Store filtered data in the dictionary with the seller name as key
-        data_by_sellers[seller['SIGLAS']] = filtered_data
 
-    return data_by_sellers
+def get_rows_by_day(df_data: DataFrame) -> dict[str, ndarray]:
+    """
+    Locate the rows of every day with a single pass over the 'DIAS' column.
 
+    Args:
+        df_data (DataFrame): DataFrame to be filtered.
 
-def filter_data_by_day(df_data: DataFrame, day: str) -> DataFrame:
+    Returns:
+        dict[str, ndarray]: The positions of the rows of each day.
+    """
+    return df_data.groupby('DIAS', observed=True, sort=False).indices
+
+
+def filter_data_by_day(df_data: DataFrame, day: str, rows_by_day: dict[str, ndarray]) -> DataFrame:
     """
     Filter DataFrame based on the specified day.
 
     Args:
         df_data (DataFrame): DataFrame to be filtered.
         day (str): The day to filter data for.
+        rows_by_day (dict[str, ndarray]): The positions of the rows of each day, from `get_rows_by_day`.
 
     Returns:
         DataFrame: Filtered DataFrame containing data for the specified day.
     """
-    return df_data[df_data['DIAS'] == day]
+    rows = rows_by_day.get(day)
+
+    # Take the rows by position instead of scanning the whole column again
+    return df_data.take(rows) if rows is not None else df_data.iloc[0:0]
 
 
-def process_data_by_type(data_by_type: dict, day_indicator: str, message_day: str) -> dict:
+def process_data_by_type(df_data: DataFrame, message_day: str) -> DataFrame:
     """
-    Process data for each type of user (resellers or sellers) by filtering it based on the day,
-    processing it, and adding a message column with the specified day.
+    Process data for one type of user (resellers or sellers) already filtered by day,
+    and add a message column with the specified day.
+
+    All the users are processed together, so pandas is entered once per type of user instead of once per user.
 
     Args:
-        data_by_type (dict): Dictionary containing data for each type of user.
-        day_indicator (str): Indicator for the day to filter data ('0' for today, '1' for tomorrow).
+        df_data (DataFrame): Data of one type of user for one day, tagged with the 'SIGLAS' of each user.
         message_day (str): Day to include in the message column.
 
     Returns:
-        dict: Processed data for each type of user.
+        DataFrame: Processed data of every user of this type, with the user's initials in the 'SIGLAS' column.
     """
-    processed_data = {}
-    for user, data in data_by_type.items():
-        filtered_data = filter_data_by_day(data, day_indicator)
-        processed_data[user] = process_data(filtered_data)
-        processed_data[user] = add_message_column(processed_data[user], message_day)
+    processed_data = process_data(df_data)
+    processed_data = add_message_column(processed_data, message_day)
+
     return processed_data
 
 
@@ -237,43 +379,49 @@ def get_info_of_customers(
     Returns:
         DataFrame: A DataFrame containing processed data of customers and resellers.
     """
-    creds_path = config('CREDS_PATH')
-
-    # Variables
-    desired_columns = ['WSP', 'PLAT.', 'CORTE', 'CLIENTE', 'PANTALLA', 'INDICATIVO', 'CONTACTO', 'VALOR', 'DIAS']
-    final_columns = ['VENDEDOR', 'CLIENTE', 'TELEFONO', 'MENSAJE']
-
-    # Get the worksheet
-    ws = get_worksheet(creds_path)
-
-    # Get all values from the worksheet
-    data = ws.get_all_values()
+    # Get all values from the worksheet and the sellers and resellers ranges in a single request
+    data, customers_values, resellers_values = get_cached_values(CREDS_PATH, SPREADSHEET_TITLE, (
+        absolute_range_name(WORKSHEET_TITLE, DATA_COLUMNS or None),
+        absolute_range_name(WORKSHEET_TITLE, 'Vendedores'),
+        absolute_range_name(WORKSHEET_TITLE, 'Revendedores'),
+    ))
 
     # Create DataFrames for sellers and resellers
-    df_customers = get_dataframe_by_range_name(ws, 'Vendedores')
-    df_resellers = get_dataframe_by_range_name(ws, 'Revendedores')
+    df_customers = get_dataframe_from_columns(customers_values)
+    df_resellers = get_dataframe_from_columns(resellers_values)
 
-    # Create the original DataFrame from the retrieved data
-    df_original = DataFrame(data[3:], columns=data[2])
+    # Create the original DataFrame from the retrieved data, backed by Arrow strings instead of Python objects
+    df_original = get_dataframe_from_columns(data, header_index=2).convert_dtypes(dtype_backend='pyarrow')
 
     # Clean the original DataFrame
-    df_cleaned = clean_data(df_original, desired_columns)
+    df_cleaned = clean_data(df_original, DESIRED_COLUMNS)
 
-    # Get data for sellers and resellers
-    df_data_by_customers = filter_data_by_user_type(df_cleaned, df_customers, 'seller')
-    df_data_by_resellers = filter_data_by_user_type(df_cleaned, df_resellers, 'reseller')
+    # Get data for sellers and resellers on their day
+    rows_by_day = get_rows_by_day(df_cleaned)
+    df_data_customers = filter_data_by_user_type(
+        filter_data_by_day(df_cleaned, index_day_customers, rows_by_day), df_customers, 'seller')
+    df_data_resellers = filter_data_by_user_type(
+        filter_data_by_day(df_cleaned, index_day_reseller, rows_by_day), df_resellers, 'reseller')
 
     # Process data for sellers and resellers
-    processed_data_customers = process_data_by_type(df_data_by_customers, index_day_customers, message_day_customers)
-    processed_data_resellers = process_data_by_type(df_data_by_resellers, index_day_reseller, message_day_resellers)
+    processed_data_customers = process_data_by_type(df_data_customers, message_day_customers)
+    processed_data_resellers = process_data_by_type(df_data_resellers, message_day_resellers)
 
-    # Concatenate DataFrames of resellers and sellers into one DataFrame
-    df_combined = concat(list(processed_data_resellers.values()) + list(processed_data_customers.values()),
-                         ignore_index=True)[final_columns]
+    # Join the final columns of both frames with one contiguous array per column, under a fresh RangeIndex
+    frames = (processed_data_resellers, processed_data_customers)
+    df_combined = DataFrame({column: concatenate([df[column].to_numpy() for df in frames]) for column in FINAL_COLUMNS})
 
     return df_combined
 
 
-def filter_data_by_vendor(initials: str, df_data: DataFrame) -> list[dict[any, any]]:
-    df_by_vendor = df_data[df_data['VENDEDOR'] == initials]
-    return df_by_vendor.to_dict('records')
+def group_data_by_vendor(df_data: DataFrame) -> dict[str, DataFrame]:
+    """
+    Get the customers of every vendor, splitting the data with a single groupby.
+
+    Args:
+        df_data (DataFrame): DataFrame containing the processed data of customers and resellers.
+
+    Returns:
+        dict[str, DataFrame]: The customers of each vendor, keyed by the vendor's initials.
+    """
+    return dict(list(df_data.groupby('VENDEDOR', observed=True, sort=False)))
@@ -1,18 +1,21 @@
+import atexit
 import os
 import subprocess as sb
 import time
-from tkinter import messagebox
+from typing import NamedTuple, TextIO
 from urllib.parse import quote
 
 import pyautogui as pg
 from decouple import config
+from numpy import ndarray
 from pandas import DataFrame
 from pywhatkit.core import core, exceptions
 
-from data import get_info_of_customers, filter_data_by_vendor
+from data import get_info_of_customers, group_data_by_vendor
 
 CHROME_PATH = config('CHROME_PATH')
 EDGE_PATH = config('EDGE_PATH')
+AUTO_CONFIRM = config('AUTO_CONFIRM', default=False, cast=bool)  # Skip the prompt on unattended runs
 
 WAIT_TIME_PER_CUSTOMER: int = 15  # Time to wait before sending the message
 CLOSE_TAB_WAIT_TIME: int = 2  # Time to wait before closing the tab
@@ -25,6 +28,43 @@ MSG_DAY_RES = 'Mañana empieza'
 VEND_INI_EDGE = 'BGL'
 VEND_INI_CHROME = 'SAG'
 
+log_file: TextIO | None = None  # Log file of the run, opened on the first sent message
+
+
+class CustomerBatch(NamedTuple):
+    """
+    Customers of a vendor stored as parallel arrays, one item per customer.
+    """
+    customers: ndarray
+    phones: ndarray
+    messages: ndarray
+    urls: ndarray
+
+
+def get_log_file(_time: time.struct_time) -> TextIO:
+    """
+    Get the log file of the run, opening it once and closing it when the program exits.
+
+    Parameters:
+        _time (time.struct_time): The time used to name the log file.
+
+    Returns:
+        TextIO: The buffered log file.
+    """
+    global log_file
+
+    if log_file is None:
+        folder_path = "logs"
+        if not os.path.exists(folder_path):
+            os.makedirs(folder_path)
+
+        file_path = os.path.join(folder_path, f'{_time.tm_mday}_{_time.tm_mon}_{_time.tm_year}.txt')
+
+        log_file = open(file_path, "a", encoding="utf-8", buffering=1 << 16)
+        atexit.register(log_file.close)
+
+    return log_file
+
 
 def log_sent_message(_time: time.struct_time, customer: str, phone_number: str, message: str) -> None:
     """
@@ -40,25 +80,66 @@ def log_sent_message(_time: time.struct_time, customer: str, phone_number: str,
         None
     """
 
-    folder_path = "logs"
-    if not os.path.exists(folder_path):
-        os.makedirs(folder_path)
+    file = get_log_file(_time)
+    file.write(
+        f"Time: {_time.tm_hour}:{_time.tm_min}:{_time.tm_sec}\n"
+        f"Customer: {customer}\n"
+        f"Phone Number: {phone_number}\n"
+        f"Message: {message}"
+    )
+    file.write("\n--------------------\n")
+
+    # The log is the record of the messages already sent, write it out now in case the run is killed
+    file.flush()
+
 
-    file_path = os.path.join(folder_path, f'{_time.tm_mday}_{_time.tm_mon}_{_time.tm_year}.txt')
+def add_url_column(df: DataFrame) -> DataFrame:
+    """
+    Check the phone number of every customer to message and add the WhatsApp Web 'URL' of each message.
 
-    with open(file_path, "a", encoding="utf-8") as file:
-        file.write(
-            f"Time: {_time.tm_hour}:{_time.tm_min}:{_time.tm_sec}\n"
-            f"Customer: {customer}\n"
-            f"Phone Number: {phone_number}\n"
-            f"Message: {message}"
-        )
-        file.write("\n--------------------\n")
-        file.close()
+    Everything is prepared before the confirmation dialog, so no string work happens while sending.
+    Only the customers that will be messaged should be passed, as any missing country code stops the run.
+
+    Args:
+        df (DataFrame): DataFrame with the 'CLIENTE', 'TELEFONO' and 'MENSAJE' of each customer.
+
+    Returns:
+        DataFrame: A new DataFrame with the 'URL' column added.
+
+    Raises:
+        exceptions.CountryCodeException: If country code is missing in any phone number.
+    """
+    # Same rule as core.check_number, applied to all the phone numbers at once
+    phones = df['TELEFONO']
+    missing_country_code = ~(phones.str.contains('+', regex=False) | phones.str.contains('_', regex=False))
+    if missing_country_code.any():
+        customers = ', '.join(df.loc[missing_country_code, 'CLIENTE'])
+        raise exceptions.CountryCodeException(f"Country Code Missing in Phone Number of: {customers}")
+
+    # Construct the URL for sending a WhatsApp message using the provided phone number and message content
+    return df.assign(URL=[f"https://web.whatsapp.com/send?phone={phone}&text={quote(message)}"
+                          for phone, message in zip(df['TELEFONO'].to_numpy(), df['MENSAJE'].to_numpy())])
+
+
+def get_customer_batch(df: DataFrame) -> CustomerBatch:
+    """
+    Get the columns needed to send the messages as parallel arrays.
+
+    Args:
+        df (DataFrame): DataFrame with the 'CLIENTE', 'TELEFONO', 'MENSAJE' and 'URL' of each customer.
+
+    Returns:
+        CustomerBatch: The customers as parallel arrays.
+    """
+    return CustomerBatch(customers=df['CLIENTE'].to_numpy(), phones=df['TELEFONO'].to_numpy(),
+                         messages=df['MENSAJE'].to_numpy(), urls=df['URL'].to_numpy())
 
 
 def send_wsp_msg(
-        customer: dict,
+        customer: str,
+        phone_number: str,
+        message: str,
+        url: str,
         close_tab_after_send: bool = False,
         browser_path: str = EDGE_PATH
 ) -> None:
@@ -66,20 +147,15 @@ def send_wsp_msg(
     Send WhatsApp message instantly.
 
     Args:
-        customer (dict): Info like name, phone and message about the customer
+        customer (str): The name of the customer.
+        phone_number (str): The phone number of the customer.
+        message (str): The content of the message.
+        url (str): The WhatsApp Web URL of the message, see `add_url_column`.
         close_tab_after_send (bool): Whether to close the browser tab after sending the message, default is False.
         browser_path (str): Path to the browser executable, default is EDGE.
-
-    Raises:
-        exceptions.CountryCodeException: If country code is missing in the phone number.
     """
 
-    if not core.check_number(number=customer['TELEFONO']):
-        raise exceptions.CountryCodeException("Country Code Missing in Phone Number!")
-
-    # Construct the URL for sending a WhatsApp message using the provided phone number and message content
-    url = f"https://web.whatsapp.com/send?phone={customer['TELEFONO']}&text={quote(customer['MENSAJE'])}"
-    # Open the specified browser with the constructed URL
+    # Open the specified browser with the URL prepared by add_url_column
     sb.Popen([browser_path, url])
     # Wait for 5 seconds to ensure the WhatsApp Web page is fully loaded
     time.sleep(5)
@@ -90,46 +166,45 @@ def send_wsp_msg(
     # Simulate pressing the 'Enter' key to send the message
     pg.press("enter")
     # Log the sent message along with the current timestamp, receiver's phone number, and message content
-    log_sent_message(_time=time.localtime(), customer=customer['CLIENTE'], phone_number=customer['TELEFONO'],
-                     message=customer['MENSAJE'])
+    log_sent_message(_time=time.localtime(), customer=customer, phone_number=phone_number, message=message)
 
     if close_tab_after_send:
         core.close_tab(wait_time=CLOSE_TAB_WAIT_TIME)
 
 
-def send_messages_to_customers(customers: list[dict[str, str]], browser: str) -> None:
+def send_messages_to_customers(batch: CustomerBatch, browser: str) -> None:
     """
-    Send messages to a list of customers.
+    Send messages to a batch of customers.
 
     Args:
-        customers (List[Dict[str, str]): Dictionary containing customer information.
+        batch (CustomerBatch): Customer information as parallel arrays.
         browser (str): Path to the browser executable.
     """
 
-    for customer in customers:
-        send_wsp_msg(customer, close_tab_after_send=True,
+    for customer, phone_number, message, url in zip(batch.customers, batch.phones, batch.messages, batch.urls):
+        send_wsp_msg(customer, phone_number, message, url, close_tab_after_send=True,
                      browser_path=browser)
-        print(f"Message sent to {customer['CLIENTE']} → OK")
+        print(f"Message sent to {customer} → OK")
 
 
-def calculate_total_time(*customer_lists: list[dict[str, str]]) -> int:
+def calculate_total_time(*batches: CustomerBatch) -> int:
     """
     Calculate the total time required to send messages to all customers.
 
     Args:
-        *customer_lists (list[dict[str, str]]): Lists of customers.
+        *batches (CustomerBatch): Batches of customers.
 
     Returns:
         int: Total time in seconds required to send messages to all customers.
     """
-    number_of_customers = sum(len(customers) for customers in customer_lists)
+    number_of_customers = sum(len(batch.customers) for batch in batches)
     time_per_customer = WAIT_TIME_PER_CUSTOMER + CLOSE_TAB_WAIT_TIME
     return number_of_customers * time_per_customer
 
 
 def show_confirmation_dialog(n_customers: int, time_expected_secs: int) -> bool:
     """
-    Show a confirmation dialog with the estimated time and ask the user to continue or cancel.
+    Show the estimated time in the console and ask the user to continue or cancel.
 
     Args:
         n_customers (int): Number of customers.
@@ -142,18 +217,17 @@ def show_confirmation_dialog(n_customers: int, time_expected_secs: int) -> bool:
     seconds = time_expected_secs % 60
     message = (f"Clientes: {n_customers} \n"
                f"Tiempo estimado: {minutes} minutos y {seconds} segundos")
-    result = messagebox.askyesno("Confirmación", message)
-    return result
+    print(message)
+    if AUTO_CONFIRM:
+        return True
+    return input('¿Desea continuar? [y/N]: ').strip().lower() == 'y'
 
 
-def show_end_dialog() -> str:
+def show_end_dialog() -> None:
     """
-    Display an end-of-program notification dialog.
-
-    Returns:
-    str: A string indicating that the program has finished.
+    Display an end-of-program notification in the console.
     """
-    return messagebox.showinfo("Notificación", "El programa ha finalizado.")
+    print("El programa ha finalizado.")
 
 
 def save_info_as_csv(df: DataFrame) -> None:
@@ -179,23 +253,23 @@ def save_info_as_csv(df: DataFrame) -> None:
     df.to_csv(file_path)
 
 
-def print_customers(vendor: str, dict_customer: list[dict]):
+def print_customers(vendor: str, batch: CustomerBatch):
     """
     Print customer information for a specific vendor.
 
     Args:
     vendor (str): The initials of the vendor.
-    dict_customer (list[dict]): A list of dictionaries containing customer information.
+    batch (CustomerBatch): Customer information as parallel arrays.
 
     Returns:
     None
     """
 
-    if len(dict_customer) > 0:
+    if len(batch.customers) > 0:
         print(f"VENDEDOR: {vendor}".center(17, '*'))
 
-        for i, customer in enumerate(dict_customer, start=1):
-            print(f"{i}) CLIENTE: {customer['CLIENTE']} - MENSAJE: {customer['MENSAJE']}")
+        for i, (customer, message) in enumerate(zip(batch.customers, batch.messages), start=1):
+            print(f"{i}) CLIENTE: {customer} - MENSAJE: {message}")
 
         print()
 
@@ -205,8 +279,10 @@ def print_customers(vendor: str, dict_customer: list[dict]):
 df_customers = get_info_of_customers(IDX_DAY_CUST, MSG_DAY_CUST, IDX_DAY_RES, MSG_DAY_RES)
 save_info_as_csv(df_customers)
 
-customers_edge = filter_data_by_vendor(VEND_INI_EDGE, df_customers)
-customers_chrome = filter_data_by_vendor(VEND_INI_CHROME, df_customers)
+# Only the customers of the vendors that are messaged get their phones checked and their URLs built
+customers_by_vendor = group_data_by_vendor(df_customers)
+customers_edge = get_customer_batch(add_url_column(customers_by_vendor.get(VEND_INI_EDGE, df_customers.iloc[0:0])))
+customers_chrome = get_customer_batch(add_url_column(customers_by_vendor.get(VEND_INI_CHROME, df_customers.iloc[0:0])))
 
 total_time = calculate_total_time(customers_edge, customers_chrome)
 total_customers = df_customers.shape[0]